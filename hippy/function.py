@@ -1,5 +1,6 @@
 from hippy.objects.base import W_Root
 from hippy.objects.reference import W_Reference
+from hippy.objects.instanceobject import W_InstanceObject
 from hippy import consts
 from rpython.rlib import jit
 
@@ -127,7 +128,6 @@ class Function(AbstractFunction):
     def call_args(self, interp, args_w, w_this=None, thisclass=None,
                   closureargs=None):
         from hippy.interpreter import Frame
-        from hippy.objects.instanceobject import W_InstanceObject
         # XXX warn if too many arguments and this function does not call
         # func_get_arg() & friends
         if w_this is not None:
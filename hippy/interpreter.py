@@ -1392,7 +1392,9 @@ class Interpreter(object):
     @jit.unroll_safe
     def CALL(self, bytecode, frame, space, arg, pc):
         func = frame.pop()
-        args_w = [frame.peek_nth(arg - i - 1) for i in range(arg)]
+        args_w = [None] * arg
+        for i in range(arg):
+            args_w[i] = frame.peek_nth(arg - i - 1)
         if isinstance(func, hippy.klass.W_BoundMethod):
             if func.method_func.name == '__clone':
                 self.fatal("Cannot call __clone() method on "
@@ -304,12 +304,9 @@ class ClassBase(AbstractFunction, AccessMixin):
     def get_methods(self, contextclass):
         '''Returns a list of accessible method names for the given context.'''
         methods = []
-        for method_name, method in self.methods.iteritems():
-            try:
-                self._visibility_check(method, method_name, contextclass)
+        for method in self.methods.itervalues():
+            if self._is_visible(method, contextclass):
                 methods.append(method.get_name())
-            except VisibilityError:
-                pass
 
         return methods
 
@@ -409,6 +406,15 @@ class ClassBase(AbstractFunction, AccessMixin):
                 raise VisibilityError("private", result.getclass(),
                                       name, contextclass)
 
+    def _is_visible(self, result, contextclass):
+        """Like _visibility_check(), but returns a bool instead of
+        raising VisibilityError."""
+        if result.is_protected():
+            return self.can_access_protected_properties_from(contextclass)
+        elif result.is_private():
+            return result.getclass() is contextclass
+        return True
+
     @jit.elidable
     def is_parent_of(self, otherclass):
         while otherclass is not self:
@@ -1187,6 +1193,8 @@ class Method(ClassMember):
 
 
 class W_BoundMethod(AbstractFunction):
+    _immutable_fields_ = ['w_instance', 'klass', 'method_func']
+
     def __init__(self, w_instance, klass, method_func):
         self.w_instance = w_instance
         self.klass = klass
@@ -1205,6 +1213,8 @@ class W_BoundMethod(AbstractFunction):
 
 
 class W_UnderUnderCall(AbstractFunction):
+    _immutable_fields_ = ['call_func']
+
     def __init__(self, name, call_func):
         self.name = name
         self.call_func = call_func
@@ -1220,6 +1230,8 @@ class W_UnderUnderCall(AbstractFunction):
 
 
 class W_InvokeCall(AbstractFunction):
+    _immutable_fields_ = ['klass', 'call_func', 'w_obj']
+
     def __init__(self, klass, call_func, w_obj):
         self.klass = klass
         self.call_func = call_func